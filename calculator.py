@@ -24,11 +24,20 @@ Commands:
 Notes:
   - Enter interest as a percentage (e.g., '2.5%' or '2.5').
   - i=0 is handled using the correct limit formulas.
+  - 'table F_P 1%..10% x 1..30' prints a factor grid (requires numpy).
+  - 'jit' swaps in numba-compiled factors for heavy workloads (requires numba).
   - Type 'help' to reprint this message, or 'quit' / 'exit' to leave.
 """
 import re
-import math
 import sys
+import functools
+
+from finance_factors import FACTOR_FUNCS, FACTOR_ALIASES, CALL_RE, BASE_ENV
+try:
+    import factors_vec
+except ImportError:
+    # numpy not installed; the 'table' command is disabled
+    factors_vec = None
 try:
     from colorama import init, Fore, Style
     init(autoreset=True)
@@ -47,80 +56,85 @@ except ImportError:
 
 HELP = __doc__
 
-# ------- Core factor formulas -------
-
-def _pow1p(i, n):
-    # Stable power for (1+i)^n
-    return (1.0 + i) ** n
-
-def F_P(i, n):
-    return _pow1p(i, n)
-
-def P_F(i, n):
-    return 1.0 / _pow1p(i, n)
-
-def P_A(i, n):
-    if i == 0.0:
-        return float(n)
-    return (1.0 - _pow1p(i, -n)) / i
+# ANSI prefixes concatenated once at import; per-line output then does a
+# single format instead of stacking four temporary strings.
+RED_B = Fore.RED + Style.BRIGHT
+GREEN_B = Fore.GREEN + Style.BRIGHT
+YELLOW_B = Fore.YELLOW + Style.BRIGHT
+CYAN_B = Fore.CYAN + Style.BRIGHT
+MAGENTA_B = Fore.MAGENTA + Style.BRIGHT
+BLUE_B = Fore.BLUE + Style.BRIGHT
+RESET = Style.RESET_ALL
 
-def A_P(i, n):
-    if i == 0.0:
-        return 1.0 / n if n != 0 else float('inf')
-    x = _pow1p(i, n)
-    return i * x / (x - 1.0)
+# ANSI clear-screen + cursor-home; a single write beats spawning cls/clear
+# and works on modern Windows terminals too.
+CLEAR_SEQ = "\x1b[2J\x1b[H"
 
-def F_A(i, n):
-    if i == 0.0:
-        return float(n)
-    return (_pow1p(i, n) - 1.0) / i
+def _clear():
+    sys.stdout.write(CLEAR_SEQ)
+    sys.stdout.flush()
 
-def A_F(i, n):
-    if i == 0.0:
-        return 1.0 / n if n != 0 else float('inf')
-    return i / (_pow1p(i, n) - 1.0)
+# Compiled once at import; the REPL runs these on every input line.
+PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+ASSIGN_RE = re.compile(r'^\s*([a-zA-Z_]\w*)\s*=\s*(.+)$')
 
-def A_G(i, n):
-    if i == 0.0:
-        # limit as i -> 0 for arithmetic gradient with 0, G, 2G, ..., (n-1)G
-        return (n - 1.0) / 2.0
-    return (1.0 / i) - (n / (_pow1p(i, n) - 1.0))
+# Intro banner, rendered once at import; the literals never change so there
+# is no reason to rebuild them on every repaint.
+_INTRO_BORDER = BLUE_B + "=" * 60 + RESET
+INTRO_LINES = (
+    _INTRO_BORDER,
+    (MAGENTA_B + "FINANCIAL CALCULATOR CLI" + RESET).center(60),
+    (CYAN_B + "Type mathematical expressions, finance factors, or commands.\nType 'help' for instructions, 'cls' to clear, 'case' to start a scoped session." + RESET).center(60),
+    _INTRO_BORDER,
+)
 
-def P_G(i, n):
-    # Use relation P/G = (A/G) * (P/A)
-    return A_G(i, n) * P_A(i, n)
+@functools.lru_cache(maxsize=256)
+def _compile_expr(src):
+    # Cache code objects so re-entered expressions skip the parse/compile step.
+    return compile(src, '<repl>', 'eval')
 
-FACTOR_FUNCS = {
-    'F_P': F_P,
-    'P_F': P_F,
-    'P_A': P_A,
-    'A_P': A_P,
-    'F_A': F_A,
-    'A_F': A_F,
-    'A_G': A_G,
-    'P_G': P_G,
-}
-
-FACTOR_ALIASES = {k.lower(): k for k in FACTOR_FUNCS}
-
-CALL_RE = re.compile(r"""
-    ^\s*
-    (?P<factor>[A-Za-z]+_[A-Za-z]+)   # e.g., A_P
-    \s*\(\s*
-    (?P<i>[-+]?\d+(\.\d+)?)(\s*%)?    # interest as percent, optional %
-    \s*,\s*
-    (?P<n>\d+)\s*
-    \)\s*$
-""", re.VERBOSE)
+def _fast_parse(line):
+    # Plain string-op parse of the common 'NAME(i[%], n)' shape; several
+    # times faster than the CALL_RE engine. Returns None on anything it is
+    # not sure about so parse_line can fall back to the regex (and its
+    # error messages).
+    head, sep, rest = line.partition('(')
+    if not sep:
+        return None
+    body, sep, tail = rest.partition(')')
+    if not sep or tail.strip():
+        return None
+    parts = body.split(',')
+    if len(parts) != 2:
+        return None
+    key = FACTOR_ALIASES.get(head.strip().lower())
+    if key is None:
+        return None
+    i_str = parts[0].strip()
+    if i_str.endswith('%'):
+        i_str = i_str[:-1].rstrip()
+    digits = i_str[1:] if i_str[:1] in '+-' else i_str
+    # CALL_RE's \d+(\.\d+)? requires digits on both sides of the point, so
+    # bail on forms like '5.' or '.5' rather than widening the grammar.
+    if digits[:1] == '.' or digits[-1:] == '.' or not digits.replace('.', '', 1).isdigit():
+        return None
+    n_str = parts[1].strip()
+    if not n_str.isdigit():
+        return None
+    return key, round(float(i_str), 10) / 100.0, int(n_str)
 
 def parse_line(line):
+    parsed = _fast_parse(line)
+    if parsed is not None:
+        return parsed
     m = CALL_RE.match(line)
     if not m:
         raise ValueError("Could not parse. Expected like: A_P(2.5%, 10)")
     factor = m.group('factor').strip()
     i_percent = float(m.group('i'))
     # Interpret numbers as percentages by default (2.5 -> 2.5%)
-    i = i_percent / 100.0
+    # Round before dividing so identical textual inputs hit the same cache key.
+    i = round(i_percent, 10) / 100.0
     n = int(m.group('n'))
     key = FACTOR_ALIASES.get(factor.lower())
     if key is None:
@@ -133,135 +147,198 @@ def evaluate(expr):
     return name, i, n, val
 
 def repl():
-    print(Fore.CYAN + Style.BRIGHT + HELP + Style.RESET_ALL)
-    import os
+    # Loop-invariant strings, built once rather than re-concatenated per line
+    prompt = YELLOW_B + "factor> " + RESET
+    help_text = CYAN_B + HELP + RESET
+    print(help_text)
     user_vars = {}
     case_stack = []
     screen_stack = []  # stores (user_vars, session_history)
     session_history = []  # stores (input, output) tuples
     in_case = False
+    def push_history(inp, outp):
+        # Render the echoed prompt line once at append time so replaying
+        # history on endcase is pure prints, independent of entry count.
+        session_history.append((prompt + inp if inp is not None else None, outp))
+
     def print_history(history):
-        for inp, outp in history:
-            if inp is not None:
-                print(Fore.YELLOW + Style.BRIGHT + f"factor> {inp}" + Style.RESET_ALL)
+        for rendered, outp in history:
+            if rendered is not None:
+                print(rendered)
             if outp is not None:
                 print(outp)
 
     def print_intro():
-        box_color = Fore.BLUE + Style.BRIGHT
-        title_color = Fore.MAGENTA + Style.BRIGHT
-        desc_color = Fore.CYAN + Style.BRIGHT
-        border = box_color + "=" * 60 + Style.RESET_ALL
-        title = title_color + "FINANCIAL CALCULATOR CLI" + Style.RESET_ALL
-        desc = desc_color + "Type mathematical expressions, finance factors, or commands.\nType 'help' for instructions, 'cls' to clear, 'case' to start a scoped session." + Style.RESET_ALL
-        print(border)
-        print(title.center(60))
-        print(desc.center(60))
-        print(border)
+        for intro_line in INTRO_LINES:
+            print(intro_line)
+
+    # Command handlers; each returns True to keep looping, False to quit.
+    # A single dict lookup replaces the old chain of line.lower() compares.
+    def cmd_quit(line):
+        print(Fore.MAGENTA + "Goodbye!" + RESET)
+        return False
+
+    def cmd_help(line):
+        print(help_text)
+        push_history(line, help_text)
+        return True
+
+    def cmd_cls(line):
+        _clear()
+        # Drop only the current scope's entries; outer history stays intact.
+        del session_history[screen_stack[-1][1] if screen_stack else 0:]
+        return True
+
+    def cmd_case(line):
+        nonlocal user_vars, in_case
+        # Save current variables and where this case's history begins;
+        # truncating back on endcase is O(1) instead of copying the list.
+        screen_stack.append((user_vars.copy(), len(session_history)))
+        user_vars = {}
+        in_case = True
+        _clear()
+        msg = MAGENTA_B + "Case started. Variables now local to this case." + RESET
+        print(msg)
+        push_history(line, msg)
+        return True
+
+    def cmd_endcase(line):
+        nonlocal user_vars, in_case
+        if screen_stack:
+            user_vars, prev_len = screen_stack.pop()
+            in_case = False
+            _clear()
+            msg = MAGENTA_B + "Case ended. Previous variables restored." + RESET
+            print(msg)
+            del session_history[prev_len:]
+            # Replay only the restored scope; entries before a still-open
+            # outer case stay hidden until that case ends too.
+            print_history(session_history[screen_stack[-1][1] if screen_stack else 0:])
+            push_history(line, msg)
+        else:
+            msg = RED_B + "No case to end." + RESET
+            print(msg)
+            push_history(line, msg)
+        return True
+
+    def cmd_table(line):
+        # table <factor> <lo>%..<hi>% x <lo>..<hi> -- vectorized grid
+        if factors_vec is None:
+            msg = f"{RED_B}'table' requires numpy (pip install numpy).{RESET}"
+            print(msg)
+            push_history(line, msg)
+            return True
+        try:
+            _, name, i_spec, sep, n_spec = line.split()
+            if sep.lower() != 'x':
+                raise ValueError(sep)
+            key = FACTOR_ALIASES[name.lower()]
+            i_lo, i_hi = (float(s.rstrip('% \t')) for s in i_spec.split('..'))
+            n_lo, n_hi = (int(s) for s in n_spec.split('..'))
+        except (ValueError, KeyError):
+            msg = f"{RED_B}Usage: table F_P 1%..10% x 1..30{RESET}"
+            print(msg)
+            push_history(line, msg)
+            return True
+        i_pcts = []
+        p = i_lo
+        while p <= i_hi + 1e-9:
+            i_pcts.append(p)
+            p += 1.0
+        n_values = list(range(n_lo, n_hi + 1))
+        grid = factors_vec.factor_table(
+            key, [round(pct, 10) / 100.0 for pct in i_pcts], n_values)
+        rows = ["i \\ n".ljust(8) + "".join(str(n).rjust(12) for n in n_values)]
+        for pct, row in zip(i_pcts, grid):
+            rows.append(f"{pct:g}%".ljust(8) + "".join(f"{val:12.6g}" for val in row))
+        outp = CYAN_B + "\n".join(rows) + RESET
+        print(outp)
+        push_history(line, outp)
+        return True
+
+    def cmd_jit(line):
+        import finance_factors_jit
+        if finance_factors_jit.HAVE_NUMBA:
+            FACTOR_FUNCS.update(finance_factors_jit.FACTOR_FUNCS_JIT)
+            BASE_ENV.update(finance_factors_jit.FACTOR_FUNCS_JIT)
+            msg = f"{MAGENTA_B}Factor functions swapped to numba-compiled versions.{RESET}"
+        else:
+            msg = f"{RED_B}'jit' requires numba (pip install numba).{RESET}"
+        print(msg)
+        push_history(line, msg)
+        return True
+
+    commands = {
+        '': cmd_quit,
+        'quit': cmd_quit,
+        'exit': cmd_quit,
+        'help': cmd_help,
+        'cls': cmd_cls,
+        'case': cmd_case,
+        'endcase': cmd_endcase,
+        'jit': cmd_jit,
+    }
 
     # Initial screen content
-    os.system('cls' if os.name == 'nt' else 'clear')
+    _clear()
     print_intro()
     while True:
         try:
-            line = input(Fore.YELLOW + Style.BRIGHT + "factor> " + Style.RESET_ALL).strip()
+            line = input(prompt).strip()
         except (EOFError, KeyboardInterrupt):
             print()
             break
-        if line.lower() in {"", "quit", "exit"}:
-            print(Fore.MAGENTA + "Goodbye!" + Style.RESET_ALL)
+        low = line.lower()
+        handler = commands.get(low)
+        if handler is None and (low == 'table' or low.startswith('table ')):
+            handler = cmd_table
+        if handler is not None:
+            if handler(line):
+                continue
             break
-        if line.lower() == "help":
-            print(Fore.CYAN + Style.BRIGHT + HELP + Style.RESET_ALL)
-            session_history.append((line, Fore.CYAN + Style.BRIGHT + HELP + Style.RESET_ALL))
-            continue
-        if line.lower() == "cls":
-            os.system('cls' if os.name == 'nt' else 'clear')
-            session_history = []
-            continue
-        if line.lower() == "case":
-            # Save current variables and session history
-            screen_stack.append((user_vars.copy(), session_history.copy()))
-            user_vars = {}
-            session_history = []
-            in_case = True
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(Fore.MAGENTA + Style.BRIGHT + "Case started. Variables now local to this case." + Style.RESET_ALL)
-            session_history.append((line, Fore.MAGENTA + Style.BRIGHT + "Case started. Variables now local to this case." + Style.RESET_ALL))
-            continue
-        if line.lower() == "endcase":
-            if screen_stack:
-                user_vars, prev_history = screen_stack.pop()
-                in_case = False
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print(Fore.MAGENTA + Style.BRIGHT + "Case ended. Previous variables restored." + Style.RESET_ALL)
-                print_history(prev_history)
-                session_history = prev_history
-                session_history.append((line, Fore.MAGENTA + Style.BRIGHT + "Case ended. Previous variables restored." + Style.RESET_ALL))
-            else:
-                print(Fore.RED + Style.BRIGHT + "No case to end." + Style.RESET_ALL)
-                session_history.append((line, Fore.RED + Style.BRIGHT + "No case to end." + Style.RESET_ALL))
-            continue
-        # Variable assignment: x = 49.5
-        assign_match = re.match(r'^\s*([a-zA-Z_]\w*)\s*=\s*(.+)$', line)
+        # Variable assignment: x = 49.5 (cheap '=' pre-check so expression
+        # lines, the common case, skip the regex entirely)
+        assign_match = ASSIGN_RE.match(line) if '=' in line else None
         if assign_match:
             var_name = assign_match.group(1)
             var_value_expr = assign_match.group(2)
             try:
-                safe_env = dict(FACTOR_FUNCS)
-                safe_env.update({
-                    'math': math,
-                    '__builtins__': {},
-                })
-                # Provide custom abs (remove negative sign) since builtins are stripped
-                safe_env['abs'] = lambda x: -x if x < 0 else x
-                for k in dir(math):
-                    if not k.startswith('_'):
-                        safe_env[k] = getattr(math, k)
+                safe_env = BASE_ENV.copy()
                 safe_env.update(user_vars)
-                var_value_expr = re.sub(r'(\d+(?:\.\d+)?)\s*%', lambda m: str(float(m.group(1))/100), var_value_expr)
-                value = eval(var_value_expr, safe_env)
+                var_value_expr = PERCENT_RE.sub(lambda m: str(float(m.group(1))/100), var_value_expr)
+                value = eval(_compile_expr(var_value_expr), safe_env)
                 user_vars[var_name] = value
-                session_history.append((line, None))
+                push_history(line, None)
             except Exception as e:
-                err = Fore.RED + Style.BRIGHT + f"Error in assignment: {e}" + Style.RESET_ALL
+                err = f"{RED_B}Error in assignment: {e}{RESET}"
                 print(err)
-                session_history.append((line, err))
+                push_history(line, err)
             continue
-        # Print variable value if line is a variable name
-        var_print_match = re.match(r'^\s*([a-zA-Z_]\w*)\s*$', line)
-        if var_print_match:
-            var_name = var_print_match.group(1)
+        # Print variable value if line is a bare variable name (line is
+        # already stripped, so no regex needed here)
+        if line.isidentifier():
+            var_name = line
             if var_name in user_vars:
-                outp = Fore.CYAN + Style.BRIGHT + f"{var_name} = {user_vars[var_name]}" + Style.RESET_ALL
+                outp = f"{CYAN_B}{var_name} = {user_vars[var_name]}{RESET}"
                 print(outp)
-                session_history.append((line, outp))
+                push_history(line, outp)
             else:
-                outp = Fore.RED + Style.BRIGHT + f"Variable '{var_name}' not found in current scope." + Style.RESET_ALL
+                outp = f"{RED_B}Variable '{var_name}' not found in current scope.{RESET}"
                 print(outp)
-                session_history.append((line, outp))
+                push_history(line, outp)
             continue
         try:
-            safe_env = dict(FACTOR_FUNCS)
-            safe_env.update({
-                'math': math,
-                '__builtins__': {},
-            })
-            # Provide custom abs function (remove negative sign)
-            safe_env['abs'] = lambda x: -x if x < 0 else x
-            for k in dir(math):
-                if not k.startswith('_'):
-                    safe_env[k] = getattr(math, k)
+            safe_env = BASE_ENV.copy()
             safe_env.update(user_vars)
-            expr = re.sub(r'(\d+(?:\.\d+)?)\s*%', lambda m: str(float(m.group(1))/100), line)
-            result = eval(expr, safe_env)
-            outp = Fore.GREEN + Style.BRIGHT + f"Result: {result}" + Style.RESET_ALL
+            expr = PERCENT_RE.sub(lambda m: str(float(m.group(1))/100), line)
+            result = eval(_compile_expr(expr), safe_env)
+            outp = f"{GREEN_B}Result: {result}{RESET}"
             print(outp)
-            session_history.append((line, outp))
+            push_history(line, outp)
         except Exception as e:
-            outp = Fore.RED + Style.BRIGHT + f"Error: {e}" + Style.RESET_ALL
+            outp = f"{RED_B}Error: {e}{RESET}"
             print(outp)
-            session_history.append((line, outp))
+            push_history(line, outp)
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
@@ -0,0 +1,80 @@
+"""
+Vectorized finance factors for tabulation workloads.
+
+NumPy counterparts of the scalar functions in finance_factors: each *_vec
+function accepts arrays (or scalars) for i and n and evaluates elementwise,
+so a whole sensitivity grid costs one ufunc pass instead of thousands of
+Python-level calls. The i == 0 limits are handled with masked divisors, so
+no Python control flow runs per element. Degenerate cells (e.g. n = 0 for
+A_P) come back as inf/nan rather than raising like the scalar versions.
+
+Requires numpy; the REPL's 'table' command degrades gracefully if it is
+not installed.
+"""
+import numpy as np
+
+def _masked_i(i):
+    # Divisor with zeros replaced by 1 so the main formula never divides by
+    # zero; np.where picks the limit value for those positions anyway.
+    return np.where(i == 0.0, 1.0, i)
+
+def F_P_vec(i, n):
+    return (1.0 + i) ** n
+
+def P_F_vec(i, n):
+    return (1.0 + i) ** -np.asarray(n)
+
+def P_A_vec(i, n):
+    iz = _masked_i(i)
+    return np.where(i == 0.0, n, -np.expm1(-np.asarray(n) * np.log1p(iz)) / iz)
+
+def A_P_vec(i, n):
+    iz = _masked_i(i)
+    x = (1.0 + iz) ** n
+    nz = np.where(np.asarray(n) == 0, 1.0, n)
+    zero_limit = np.where(np.asarray(n) == 0, np.inf, 1.0 / nz)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(i == 0.0, zero_limit, iz * x / (x - 1.0))
+
+def F_A_vec(i, n):
+    iz = _masked_i(i)
+    return np.where(i == 0.0, n, np.expm1(n * np.log1p(iz)) / iz)
+
+def A_F_vec(i, n):
+    iz = _masked_i(i)
+    nz = np.where(np.asarray(n) == 0, 1.0, n)
+    zero_limit = np.where(np.asarray(n) == 0, np.inf, 1.0 / nz)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(i == 0.0, zero_limit, iz / np.expm1(n * np.log1p(iz)))
+
+def A_G_vec(i, n):
+    iz = _masked_i(i)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(i == 0.0, (np.asarray(n) - 1.0) / 2.0,
+                        1.0 / iz - n / np.expm1(n * np.log1p(iz)))
+
+def P_G_vec(i, n):
+    # Same single-pow expansion of A_G * P_A as the scalar P_G.
+    iz = _masked_i(i)
+    x = (1.0 + iz) ** n
+    with np.errstate(divide='ignore', invalid='ignore'):
+        main = (1.0 / iz - n / (x - 1.0)) * ((1.0 - 1.0 / x) / iz)
+    return np.where(i == 0.0, A_G_vec(i, n) * P_A_vec(i, n), main)
+
+FACTOR_FUNCS_VEC = {
+    'F_P': F_P_vec,
+    'P_F': P_F_vec,
+    'P_A': P_A_vec,
+    'A_P': A_P_vec,
+    'F_A': F_A_vec,
+    'A_F': A_F_vec,
+    'A_G': A_G_vec,
+    'P_G': P_G_vec,
+}
+
+def factor_table(name, i_values, n_values):
+    """Evaluate factor `name` over the (i, n) grid; rows are i, columns n."""
+    fn = FACTOR_FUNCS_VEC[name]
+    i_grid = np.asarray(i_values, dtype=float)[:, None]
+    n_grid = np.asarray(n_values, dtype=float)[None, :]
+    return fn(i_grid, n_grid)
@@ -0,0 +1,113 @@
+"""
+Core finance factor formulas shared by the calculator frontends.
+
+Exports the eight factor functions (F_P, P_F, P_A, A_P, F_A, A_F, A_G, P_G),
+the FACTOR_FUNCS / FACTOR_ALIASES lookup tables, the CALL_RE parser pattern,
+and the BASE_ENV evaluation environment. Keeping them in one module means the
+memoization caches are shared by every frontend that imports them.
+"""
+import re
+import math
+import functools
+
+# The factors are memoized: REPL sessions (tables, sensitivity analyses,
+# cases) tend to re-evaluate the same (i, n) pairs over and over, so repeat
+# calls become a cache lookup instead of a pow().
+
+@functools.lru_cache(maxsize=4096)
+def _pow1p(i, n, _pow=math.pow):
+    # Stable power for (1+i)^n; math.pow bound as a default arg skips the
+    # float.__pow__ operator dispatch (measured slightly faster than **).
+    return _pow(1.0 + i, n)
+
+@functools.lru_cache(maxsize=4096)
+def _pow1p_m1(i, n):
+    # (1+i)^n - 1 without cancellation for small i, via expm1/log1p.
+    return math.expm1(n * math.log1p(i))
+
+@functools.lru_cache(maxsize=1024)
+def F_P(i, n):
+    return _pow1p(i, n)
+
+@functools.lru_cache(maxsize=1024)
+def P_F(i, n):
+    return 1.0 / _pow1p(i, n)
+
+@functools.lru_cache(maxsize=1024)
+def P_A(i, n):
+    if not i:
+        return float(n)
+    return -math.expm1(-n * math.log1p(i)) / i
+
+@functools.lru_cache(maxsize=1024)
+def A_P(i, n):
+    if not i:
+        return 1.0 / n if n != 0 else float('inf')
+    x = _pow1p(i, n)
+    return i * x / (x - 1.0)
+
+@functools.lru_cache(maxsize=1024)
+def F_A(i, n):
+    if not i:
+        return float(n)
+    return _pow1p_m1(i, n) / i
+
+@functools.lru_cache(maxsize=1024)
+def A_F(i, n):
+    if not i:
+        return 1.0 / n if n != 0 else float('inf')
+    return i / _pow1p_m1(i, n)
+
+@functools.lru_cache(maxsize=1024)
+def A_G(i, n):
+    if not i:
+        # limit as i -> 0 for arithmetic gradient with 0, G, 2G, ..., (n-1)G
+        return (n - 1.0) / 2.0
+    return (1.0 / i) - (n / _pow1p_m1(i, n))
+
+@functools.lru_cache(maxsize=1024)
+def P_G(i, n):
+    # Use relation P/G = (A/G) * (P/A), expanded so the shared (1+i)^n
+    # is computed only once and both pieces round through the same value.
+    if not i:
+        return A_G(i, n) * P_A(i, n)
+    x = _pow1p(i, n)
+    return (1.0 / i - n / (x - 1.0)) * ((1.0 - 1.0 / x) / i)
+
+FACTOR_FUNCS = {
+    'F_P': F_P,
+    'P_F': P_F,
+    'P_A': P_A,
+    'A_P': A_P,
+    'F_A': F_A,
+    'A_F': A_F,
+    'A_G': A_G,
+    'P_G': P_G,
+}
+
+FACTOR_ALIASES = {k.lower(): k for k in FACTOR_FUNCS}
+
+CALL_RE = re.compile(r"""
+    ^\s*
+    (?P<factor>[A-Za-z]+_[A-Za-z]+)   # e.g., A_P
+    \s*\(\s*
+    (?P<i>[-+]?\d+(\.\d+)?)(\s*%)?    # interest as percent, optional %
+    \s*,\s*
+    (?P<n>\d+)\s*
+    \)\s*$
+""", re.VERBOSE)
+
+# Public math names, resolved once at import; the dir(math) scan never runs
+# again after this.
+MATH_NAMES = {k: getattr(math, k) for k in dir(math) if not k.startswith('_')}
+
+# Evaluation environment shared by every REPL line; built once at import.
+# Per call the frontends only copy it and layer the user's variables on top.
+BASE_ENV = {
+    **FACTOR_FUNCS,
+    'math': math,
+    '__builtins__': {},
+    # C-level abs since builtins are stripped
+    'abs': math.fabs,
+}
+BASE_ENV.update(MATH_NAMES)
@@ -0,0 +1,92 @@
+"""
+JIT-compiled finance factors for heavy scripted workloads.
+
+Mirrors the pure-Python API of finance_factors but compiles each factor
+with numba's @njit, for solver/Monte-Carlo style code that calls them
+millions of times (e.g. goal-seeking an i for a target A). If numba is not
+installed the module still imports and FACTOR_FUNCS_JIT falls back to the
+pure-Python (memoized) functions.
+
+The REPL's 'jit' command swaps these into the shared FACTOR_FUNCS table.
+"""
+import math
+
+from finance_factors import FACTOR_FUNCS as _PY_FACTOR_FUNCS
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    njit = None
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    # Plain (uncached) helpers: numba compiles these to machine code, so the
+    # lru_cache layer of the Python versions would only add overhead here.
+    # math.inf instead of float('inf'): some numba versions reject the latter.
+
+    @njit(cache=True, fastmath=True)
+    def _pow1p(i, n):
+        return (1.0 + i) ** n
+
+    @njit(cache=True, fastmath=True)
+    def F_P(i, n):
+        return _pow1p(i, n)
+
+    @njit(cache=True, fastmath=True)
+    def P_F(i, n):
+        return 1.0 / _pow1p(i, n)
+
+    @njit(cache=True, fastmath=True)
+    def P_A(i, n):
+        if i == 0.0:
+            return float(n)
+        return -math.expm1(-n * math.log1p(i)) / i
+
+    @njit(cache=True, fastmath=True)
+    def A_P(i, n):
+        if i == 0.0:
+            return 1.0 / n if n != 0 else math.inf
+        x = _pow1p(i, n)
+        return i * x / (x - 1.0)
+
+    @njit(cache=True, fastmath=True)
+    def F_A(i, n):
+        if i == 0.0:
+            return float(n)
+        return math.expm1(n * math.log1p(i)) / i
+
+    @njit(cache=True, fastmath=True)
+    def A_F(i, n):
+        if i == 0.0:
+            return 1.0 / n if n != 0 else math.inf
+        return i / math.expm1(n * math.log1p(i))
+
+    @njit(cache=True, fastmath=True)
+    def A_G(i, n):
+        if i == 0.0:
+            return (n - 1.0) / 2.0
+        return (1.0 / i) - (n / math.expm1(n * math.log1p(i)))
+
+    @njit(cache=True, fastmath=True)
+    def P_G(i, n):
+        if i == 0.0:
+            return A_G(i, n) * P_A(i, n)
+        x = _pow1p(i, n)
+        return (1.0 / i - n / (x - 1.0)) * ((1.0 - 1.0 / x) / i)
+
+    FACTOR_FUNCS_JIT = {
+        'F_P': F_P,
+        'P_F': P_F,
+        'P_A': P_A,
+        'A_P': A_P,
+        'F_A': F_A,
+        'A_F': A_F,
+        'A_G': A_G,
+        'P_G': P_G,
+    }
+else:
+    # numba not installed; keep the module importable with the pure-Python
+    # memoized functions under the same names.
+    from finance_factors import F_P, P_F, P_A, A_P, F_A, A_F, A_G, P_G
+    FACTOR_FUNCS_JIT = dict(_PY_FACTOR_FUNCS)